@@ -20,19 +20,29 @@ CLI output shape:
 """
 
 import argparse
-import json
+import asyncio
+import hashlib
 import logging
 import os
 import re
+import ssl
 import sys
-from dataclasses import asdict, dataclass
-from typing import Any, Dict, Iterable, List, Optional, Tuple
-from concurrent.futures import ThreadPoolExecutor, as_completed
-
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, DefaultDict, Dict, Final, Iterable, List, Optional, Set, Tuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+import aiohttp
+import ijson
+import orjson
 import urllib3
+import yaml
 from kubernetes import client, config
 from kubernetes.client import ApiClient
 from kubernetes.client.exceptions import ApiException
+from kubernetes.config.kube_config import KubeConfigLoader
 
 # Silence warnings about self-signed clusters we don't control
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -41,7 +51,7 @@ log = logging.getLogger(__name__)
 
 # --------------------------- Models ---------------------------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ContainerImage:
     """
     Canonical representation of an image found in the cluster.
@@ -56,7 +66,9 @@ class ContainerImage:
     digest: Optional[str]
 
     def to_dict(self) -> Dict[str, Optional[str]]:
-        return asdict(self)
+        # Literal dict: asdict() deep-copies through a reflective field walk,
+        # which shows up at tens of thousands of instances per scan.
+        return {"ref": self.ref, "name": self.name, "digest": self.digest}
 
 
 # Structured scan result for library users
@@ -74,16 +86,33 @@ class ImageReferenceParser:
     Kept as a cohesive unit for readability and easy testing.
     """
 
-    # Generic "<algo>:<hex>" digest (future-proof beyond sha256)
-    _DIGEST_RE = re.compile(r"([A-Za-z0-9_+.\-]+):([A-Fa-f0-9]{32,128})")
     # Detect a digest embedded in a reference via "@<algo>:<hex>"
     _AT_DIGEST_RE = re.compile(r"@([A-Za-z0-9_+.\-]+):([A-Fa-f0-9]{32,128})")
     _SCHEME_RE = re.compile(r"^[a-zA-Z][a-zA-Z0-9+.\-]*://")
 
+    # Character classes for the hand-rolled digest scanner (hot path): direct
+    # index scans with frozenset membership, no backtracking regex engine.
+    # Final annotations keep these monomorphic for type checkers and any
+    # future AOT compilation of this class.
+    _ALGO_CHARS: Final[frozenset] = frozenset(
+        "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_+.-"
+    )
+    _HEX_CHARS: Final[frozenset] = frozenset("0123456789abcdefABCDEF")
+    # Delete-table form of _HEX_CHARS: translating a chunk with these as the
+    # deletion set leaves b"" iff every char was hex — one C-level pass instead
+    # of a per-character Python loop.
+    _HEX_BYTES: Final[bytes] = b"0123456789abcdefABCDEF"
+    _MIN_HEX: Final[int] = 32
+    _MAX_HEX: Final[int] = 128
+    _SHA256_HEX_LEN: Final[int] = 64
+
     @staticmethod
     def strip_scheme(s: str) -> str:
         """Remove leading URI schemes like docker://, containerd://, cri-o://, etc."""
-        if not s:
+        # Most refs carry no scheme; a windowed substring check is far cheaper
+        # than invoking the regex engine. 24 chars comfortably covers real
+        # schemes ("docker-pullable://" is the longest seen in the wild).
+        if not s or "://" not in s[:24]:
             return s
         return ImageReferenceParser._SCHEME_RE.sub("", s)
 
@@ -92,32 +121,36 @@ class ImageReferenceParser:
         """
         Basic sanity check: require a non-empty repo/name before any ':tag' or '@digest'.
         Reject "", ":", ":v1.2.3", "@sha256:...", etc.
+
+        Runs once per container, so it sticks to str.find/slicing — no regex
+        engine on the hot path.
         """
         s = ImageReferenceParser.strip_scheme((image or "").strip())
         if not s:
             return False
-        if s.startswith(":") or s.startswith("@"):
-            return False
         # Repo/name part before any ':tag' or '@digest'
-        name_part = re.split(r"[@:]", s, 1)[0]
+        at = s.find("@")
+        colon = s.find(":")
+        cut = min(at if at >= 0 else len(s), colon if colon >= 0 else len(s))
+        name_part = s[:cut]
         # Must contain at least one alphanumeric (handles things like "library/" edge cases)
-        if not re.search(r"[A-Za-z0-9]", name_part):
-            return False
-        return True
+        return any(c.isalnum() for c in name_part)
 
-    @staticmethod
-    def extract_digest(*candidates: Optional[str]) -> Optional[str]:
+    @classmethod
+    def extract_digest(cls, *candidates: Optional[str]) -> Optional[str]:
         """
         Return '<algo>:<hex>' if found in any candidate string; otherwise None.
         Examples: 'sha256:...', 'sha512:...'
+
+        Delegates to the index scanner, whose sha256 fast path resolves the
+        overwhelmingly common case with one slice + translate check.
         """
         for candidate in candidates:
             if not candidate:
                 continue
-            m = ImageReferenceParser._DIGEST_RE.search(candidate)
-            if m:
-                algo, hexd = m.group(1), m.group(2)
-                return f"{algo}:{hexd}"
+            found = cls._find_digest(candidate)
+            if found:
+                return found
         return None
 
     @staticmethod
@@ -131,11 +164,15 @@ class ImageReferenceParser:
         if not image_ref:
             return "unknown"
         no_scheme = ImageReferenceParser.strip_scheme(image_ref)
-        tail = no_scheme.rsplit("/", 1)[-1]
-        tail = tail.split("@", 1)[0]      # drop digest suffix if present
-        if ":" in tail:
-            tail = tail.split(":", 1)[0]  # drop tag if present
-        return tail or "unknown"
+        start = no_scheme.rfind("/") + 1  # 0 when there's no path separator
+        # Trim at the first '@' (digest) or ':' (tag) after the repository tail
+        end = no_scheme.find("@", start)
+        if end < 0:
+            end = len(no_scheme)
+        colon = no_scheme.find(":", start, end)
+        if colon >= 0:
+            end = colon
+        return no_scheme[start:end] or "unknown"
 
     @staticmethod
     def compose_reference(image: str, digest: Optional[str]) -> str:
@@ -156,10 +193,122 @@ class ImageReferenceParser:
         Per-namespace uniqueness key: prefer digest (content identity),
         otherwise use the reference string (case-insensitive).
         """
-        return (digest or ref).lower()
+        s = digest or ref
+        # Digests and almost all refs are already lowercase; str.lower()
+        # always allocates, so only pay for it when needed.
+        return s if s.islower() else s.lower()
 
-    @staticmethod
-    def from_statuses(statuses: Optional[List[dict]]) -> List[ContainerImage]:
+    @classmethod
+    def _find_digest(cls, s: str) -> Optional[str]:
+        """
+        Leftmost '<algo>:<32-128 hex>' substring, scanned by index — equivalent
+        to a ([A-Za-z0-9_+.\\-]+):([A-Fa-f0-9]{32,128}) regex search without
+        engine dispatch.
+        """
+        n = len(s)
+        pos = 0
+        while True:
+            colon = s.find(":", pos)
+            if colon < 0:
+                return None
+            # Maximal algo run ending at the colon
+            algo_start = colon
+            while algo_start > 0 and s[algo_start - 1] in cls._ALGO_CHARS:
+                algo_start -= 1
+            if algo_start < colon:
+                hex_start = colon + 1
+                # Fast path: exactly 64 hex chars (sha256) validated with one
+                # branchless translate call instead of 64 set probes.
+                sha_end = hex_start + cls._SHA256_HEX_LEN
+                chunk = s[hex_start:sha_end]
+                if (
+                    len(chunk) == cls._SHA256_HEX_LEN
+                    and not chunk.encode().translate(None, cls._HEX_BYTES)
+                    and (sha_end >= n or s[sha_end] not in cls._HEX_CHARS)
+                ):
+                    return s[algo_start:sha_end]
+                # General case: measure the hex run, capped like the regex quantifier
+                hex_end = hex_start
+                limit = min(n, hex_start + cls._MAX_HEX)
+                while hex_end < limit and s[hex_end] in cls._HEX_CHARS:
+                    hex_end += 1
+                if hex_end - hex_start >= cls._MIN_HEX:
+                    return s[algo_start:hex_end]
+            pos = colon + 1
+
+    @classmethod
+    def _digest_starts_at(cls, s: str, i: int) -> bool:
+        """True when s[i:] begins with '<algo>:<32+ hex>' (the '@<digest>' tail check)."""
+        n = len(s)
+        j = i
+        while j < n and s[j] in cls._ALGO_CHARS:
+            j += 1
+        if j == i or j >= n or s[j] != ":":
+            return False
+        # A run of >=32 hex chars exists iff the first 32 are all hex; one
+        # translate call checks that branchlessly.
+        chunk = s[j + 1:j + 1 + cls._MIN_HEX]
+        return len(chunk) == cls._MIN_HEX and not chunk.encode().translate(None, cls._HEX_BYTES)
+
+    @classmethod
+    def _parse_image(cls, image: Optional[str], image_id: Optional[str] = None) -> Optional[ContainerImage]:
+        """
+        Parse one container image reference into a ContainerImage, or None if invalid.
+
+        Fused hot path: the separate validate / extract_digest / compose_reference /
+        short_name helpers each re-scanned the same short string; this walks it once,
+        locating the '@' / ':' separators and the repository tail by index. The
+        individual helpers remain for external callers and tests.
+        """
+        s = cls.strip_scheme((image or "").strip())
+        if not s:
+            return None
+
+        at = s.find("@")
+        colon = s.find(":")
+        cut = min(at if at >= 0 else len(s), colon if colon >= 0 else len(s))
+        # Reject junk like ":", ":v1.2.3", "@sha256:..." — the repo/name part
+        # before any separator must contain at least one alphanumeric.
+        if not any(c.isalnum() for c in s[:cut]):
+            return None
+
+        # Digest: prefer imageID (typically digest-qualified), else the ref itself.
+        digest: Optional[str] = None
+        if image_id:
+            digest = cls._find_digest(cls.strip_scheme(image_id))
+        if digest is None:
+            digest = cls._find_digest(s)
+
+        # Reference: keep as-is when already '@<algo>:<hex>'-qualified, else qualify.
+        has_at_digest = False
+        p = at
+        while p >= 0 and not has_at_digest:
+            has_at_digest = cls._digest_starts_at(s, p + 1)
+            p = s.find("@", p + 1)
+        if has_at_digest:
+            ref = s
+        elif digest:
+            ref = f"{s}@{digest}"
+        else:
+            ref = s
+
+        # Short name: repository tail, trimmed at the first '@' or ':' after it.
+        start = s.rfind("/") + 1
+        end = s.find("@", start)
+        if end < 0:
+            end = len(s)
+        tag_colon = s.find(":", start, end)
+        if tag_colon >= 0:
+            end = tag_colon
+        # Short names repeat heavily across a cluster ("pause", "nginx", …);
+        # interning costs once per unique string and collapses the rest to
+        # pointer-compared singletons in the dedupe structures.
+        name = sys.intern(s[start:end] or "unknown")
+
+        return ContainerImage(ref=ref, name=name, digest=digest)
+
+    @classmethod
+    def from_statuses(cls, statuses: Optional[List[dict]]) -> List[ContainerImage]:
         """
         Build images from containerStatuses-like objects, where imageID typically includes the digest.
         """
@@ -168,22 +317,15 @@ class ImageReferenceParser:
             return results
 
         for status in statuses:
-            image = ImageReferenceParser.strip_scheme(status.get("image") or "")
-            image_id = ImageReferenceParser.strip_scheme(status.get("imageID") or "")
-
-            # Skip junk like ":" or ":v1.2.3"
-            if not ImageReferenceParser.is_valid_image_ref(image):
-                log.debug("Skipping invalid image ref from status: %r", image)
+            parsed = cls._parse_image(status.get("image"), status.get("imageID"))
+            if parsed is None:
+                log.debug("Skipping invalid image ref from status: %r", status.get("image"))
                 continue
-
-            digest = ImageReferenceParser.extract_digest(image_id, image)
-            ref = ImageReferenceParser.compose_reference(image, digest)
-            name = ImageReferenceParser.short_name(ref or image)
-            results.append(ContainerImage(ref=ref, name=name, digest=digest))
+            results.append(parsed)
         return results
 
-    @staticmethod
-    def from_container_specs(containers: Optional[List[dict]]) -> List[ContainerImage]:
+    @classmethod
+    def from_container_specs(cls, containers: Optional[List[dict]]) -> List[ContainerImage]:
         """
         Build images from spec.containers[].image when status is unavailable (e.g., Pending pods).
         """
@@ -192,24 +334,30 @@ class ImageReferenceParser:
             return results
 
         for container in containers:
-            image = ImageReferenceParser.strip_scheme(container.get("image") or "")
-
-            # Skip junk like ":" or ":v1.2.3"
-            if not ImageReferenceParser.is_valid_image_ref(image):
-                log.debug("Skipping invalid image ref from spec: %r", image)
+            parsed = cls._parse_image(container.get("image"))
+            if parsed is None:
+                log.debug("Skipping invalid image ref from spec: %r", container.get("image"))
                 continue
-
-            digest = ImageReferenceParser.extract_digest(image)
-            ref = ImageReferenceParser.compose_reference(image, digest)
-            name = ImageReferenceParser.short_name(ref or image)
-            results.append(ContainerImage(ref=ref, name=name, digest=digest))
+            results.append(parsed)
         return results
 
 
 # --------------------------- Kubernetes Wiring ---------------------------
 
 class KubernetesClientFactory:
-    """Creates Kubernetes API clients and lists contexts. Isolated for testability."""
+    """
+    Creates Kubernetes API clients and lists contexts. Isolated for testability.
+
+    Clients are cached per (host, TLS material, credentials): kubeconfigs often
+    define many contexts against the same control plane, and each ApiClient
+    owns its own urllib3 PoolManager, so reuse keeps one warm HTTPS connection
+    pool per server instead of one per context.
+    """
+
+    def __init__(self) -> None:
+        self._client_cache: Dict[Tuple, ApiClient] = {}
+        self._kubeconfig_cache: Dict[str, dict] = {}
+        self._cache_lock = threading.Lock()
 
     def list_context_names(self, kubeconfig_path: Optional[str]) -> List[str]:
         log.info("Loading kubeconfig from: %s", kubeconfig_path or "<default>")
@@ -218,15 +366,111 @@ class KubernetesClientFactory:
         log.info("Found %d context(s): %s", len(names), names)
         return names
 
+    @staticmethod
+    def _connection_key(configuration: client.Configuration) -> Tuple:
+        """Identity of a server connection: endpoint + TLS material + credentials."""
+        token = (configuration.api_key or {}).get("authorization") or ""
+        token_hash = hashlib.sha256(token.encode()).hexdigest() if token else ""
+        return (
+            configuration.host,
+            configuration.verify_ssl,
+            configuration.ssl_ca_cert,
+            configuration.cert_file,
+            configuration.key_file,
+            token_hash,
+        )
+
+    def _load_raw_kubeconfig(self, kubeconfig_path: Optional[str]) -> Optional[dict]:
+        """
+        Parse the kubeconfig YAML once per path and reuse the dict across
+        contexts: multi-context scans otherwise re-read and re-parse the same
+        file for every context. Returns None when the path doesn't resolve to
+        a single file (e.g. multi-path $KUBECONFIG), in which case callers
+        fall back to the client library's own loader.
+        """
+        path = KubeconfigLocator.resolve(kubeconfig_path)
+        if not path or os.pathsep in path or not os.path.exists(path):
+            return None
+        with self._cache_lock:
+            cached = self._kubeconfig_cache.get(path)
+        if cached is not None:
+            return cached
+        with open(path, encoding="utf-8") as fh:
+            data = yaml.safe_load(fh)
+        with self._cache_lock:
+            self._kubeconfig_cache.setdefault(path, data)
+        return data
+
+    def _new_configuration(self, context_name: str, kubeconfig_path: Optional[str]) -> client.Configuration:
+        """
+        Build a Configuration for one context — credentials and endpoint only,
+        no ApiClient (and thus no urllib3 PoolManager) behind it.
+        """
+        configuration = client.Configuration()
+        raw_config = self._load_raw_kubeconfig(kubeconfig_path)
+        if raw_config is not None:
+            KubeConfigLoader(config_dict=raw_config, active_context=context_name).load_and_set(configuration)
+        else:
+            config.load_kube_config(
+                config_file=kubeconfig_path,
+                context=context_name,
+                client_configuration=configuration,
+                persist_config=False,
+            )
+        return configuration
+
+    def resolve_host(self, context_name: str, kubeconfig_path: Optional[str]) -> str:
+        """API server host for a context, without constructing a client."""
+        return self._new_configuration(context_name, kubeconfig_path).host
+
     def new_core_v1(
         self,
         context_name: str,
         kubeconfig_path: Optional[str],
     ) -> Tuple[ApiClient, client.CoreV1Api]:
         log.info("Creating API client for context: %s (kubeconfig=%s)", context_name, kubeconfig_path or "<default>")
-        api_client = config.new_client_from_config(context=context_name, config_file=kubeconfig_path)
+        configuration = self._new_configuration(context_name, kubeconfig_path)
+
+        key = self._connection_key(configuration)
+        with self._cache_lock:
+            api_client = self._client_cache.get(key)
+            if api_client is None:
+                # Only a miss pays for an ApiClient and its connection pool.
+                api_client = ApiClient(configuration=configuration)
+                self._client_cache[key] = api_client
+            else:
+                log.debug("Reusing pooled API client for host %s", configuration.host)
+
         return api_client, client.CoreV1Api(api_client=api_client)
 
+    def new_async_connection(
+        self,
+        context_name: str,
+        kubeconfig_path: Optional[str],
+    ) -> Tuple[str, Dict[str, str], ssl.SSLContext]:
+        """
+        Resolve (host, headers, ssl_context) for a context, for the aiohttp scan path.
+        """
+        configuration = self._new_configuration(context_name, kubeconfig_path)
+        headers: Dict[str, str] = {"Accept": "application/json"}
+        token = configuration.get_api_key_with_prefix("authorization")
+        if token:
+            headers["Authorization"] = token
+        return configuration.host, headers, self._build_ssl_context(configuration)
+
+    @staticmethod
+    def _build_ssl_context(configuration: client.Configuration) -> ssl.SSLContext:
+        """Build an SSLContext from the kubeconfig cluster/user TLS material."""
+        if configuration.verify_ssl:
+            ssl_context = ssl.create_default_context(cafile=configuration.ssl_ca_cert)
+        else:
+            ssl_context = ssl.create_default_context()
+            ssl_context.check_hostname = False
+            ssl_context.verify_mode = ssl.CERT_NONE
+        if configuration.cert_file:
+            ssl_context.load_cert_chain(configuration.cert_file, configuration.key_file)
+        return ssl_context
+
 
 # --------------------------- Scanning ---------------------------
 
@@ -242,9 +486,27 @@ class KubernetesImageScanner:
         "ephemeralContainerStatuses",
     )
 
-    def __init__(self, kubeconfig_path: Optional[str], client_factory: Optional[KubernetesClientFactory] = None) -> None:
+    # Succeeded/Failed pods rarely carry image info their running peers don't,
+    # but large completed-Job backlogs are transferred and parsed anyway;
+    # filtering them server-side drops those bytes at the source.
+    TERMINAL_POD_FIELD_SELECTOR = "status.phase!=Succeeded,status.phase!=Failed"
+
+    # Full pod lists are expensive for the apiserver; many contexts often share
+    # one control plane, and hammering it in parallel just trades throughput
+    # for priority-and-fairness throttling. Unrelated clusters still go wide.
+    DEFAULT_MAX_WORKERS_PER_HOST = 4
+
+    def __init__(
+        self,
+        kubeconfig_path: Optional[str],
+        client_factory: Optional[KubernetesClientFactory] = None,
+        cache: Optional[ScanResultCache] = None,
+        include_terminated: bool = False,
+    ) -> None:
         self.kubeconfig_path = kubeconfig_path
         self.client_factory = client_factory or KubernetesClientFactory()
+        self.cache = cache
+        self.field_selector: Optional[str] = None if include_terminated else self.TERMINAL_POD_FIELD_SELECTOR
 
     # ---- Discovery entry points ------------------------------------------------
 
@@ -257,9 +519,21 @@ class KubernetesImageScanner:
         max_workers: Optional[int] = None,
         page_limit: Optional[int] = None,
         request_timeout_seconds: Optional[int] = None,
+        use_asyncio: bool = False,
+        parse_workers: Optional[int] = None,
+        max_workers_per_host: Optional[int] = None,
     ) -> Dict[str, Any]:
         """
-        Scan many contexts in parallel.
+        Scan many contexts in parallel, capping concurrency per API server
+        (max_workers_per_host, default 4) so contexts that share a control
+        plane queue instead of tripping apiserver throttling.
+
+        With use_asyncio=True, scans run on a single event loop via aiohttp
+        (see scan_multiple_contexts_async) instead of worker threads.
+
+        With parse_workers set, raw pod-list pages are parsed in that many
+        worker processes (see _parse_pods_blob), so CPU-bound parsing from
+        different contexts is not serialized by the GIL.
 
         Returns:
           {
@@ -271,6 +545,16 @@ class KubernetesImageScanner:
         if not names:
             return {}
 
+        if use_asyncio:
+            return asyncio.run(
+                self.scan_multiple_contexts_async(
+                    names,
+                    max_workers=max_workers,
+                    page_limit=page_limit,
+                    request_timeout_seconds=request_timeout_seconds,
+                )
+            )
+
         # Higher default worker cap for I/O-bound API calls
         worker_count = max_workers if max_workers is not None else min(32, len(names))
         log.info("Scanning %d context(s) with up to %d worker(s)…", len(names), worker_count)
@@ -278,29 +562,47 @@ class KubernetesImageScanner:
         results: Dict[str, Any] = {}
         errors: Dict[str, str] = {}
 
-        with ThreadPoolExecutor(max_workers=worker_count) as executor:
-            futures = {
-                executor.submit(
-                    self.scan_single_context,
-                    name,
-                    page_limit,
-                    request_timeout_seconds,
-                ): name
-                for name in names
-            }
-
-            for future in as_completed(futures):
-                name = futures[future]
-                try:
-                    results[name] = future.result()
-                except ApiException as exc:
-                    msg = f"Kubernetes API error: {exc}"
-                    errors[name] = msg
-                    log.error("[context=%s] %s", name, msg)
-                except Exception as exc:
-                    msg = f"Unexpected error: {exc.__class__.__name__}: {exc}"
-                    errors[name] = msg
-                    log.exception("[context=%s] %s", name, msg)
+        parse_executor: Optional[ProcessPoolExecutor] = None
+        if parse_workers:
+            parse_executor = ProcessPoolExecutor(max_workers=parse_workers)
+
+        per_host_cap = (
+            max_workers_per_host if max_workers_per_host is not None else self.DEFAULT_MAX_WORKERS_PER_HOST
+        )
+        host_semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        host_lock = threading.Lock()
+
+        def scan_with_host_cap(name: str) -> Dict[str, List[Dict[str, Optional[str]]]]:
+            # Resolve the context's API server first (no client construction),
+            # then queue behind its per-host semaphore; distinct hosts don't contend.
+            host = self.client_factory.resolve_host(name, self.kubeconfig_path)
+            with host_lock:
+                semaphore = host_semaphores.setdefault(host, threading.BoundedSemaphore(per_host_cap))
+            with semaphore:
+                return self.scan_single_context(name, page_limit, request_timeout_seconds, parse_executor)
+
+        try:
+            with ThreadPoolExecutor(max_workers=worker_count) as executor:
+                futures = {
+                    executor.submit(scan_with_host_cap, name): name
+                    for name in names
+                }
+
+                for future in as_completed(futures):
+                    name = futures[future]
+                    try:
+                        results[name] = future.result()
+                    except ApiException as exc:
+                        msg = f"Kubernetes API error: {exc}"
+                        errors[name] = msg
+                        log.error("[context=%s] %s", name, msg)
+                    except Exception as exc:
+                        msg = f"Unexpected error: {exc.__class__.__name__}: {exc}"
+                        errors[name] = msg
+                        log.exception("[context=%s] %s", name, msg)
+        finally:
+            if parse_executor is not None:
+                parse_executor.shutdown()
 
         if errors:
             results["__errors__"] = errors
@@ -312,50 +614,307 @@ class KubernetesImageScanner:
         context_name: str,
         page_limit: Optional[int] = None,
         request_timeout_seconds: Optional[int] = None,
+        parse_executor: Optional[ProcessPoolExecutor] = None,
     ) -> Dict[str, List[Dict[str, Optional[str]]]]:
         """
         Scan one context and return images per namespace.
         Returns:
           { "<namespace>": [ {ref,name,digest}, ... ] }
         """
-        api_client, core_v1 = self.client_factory.new_core_v1(context_name, self.kubeconfig_path)
+        api_client, _ = self.client_factory.new_core_v1(context_name, self.kubeconfig_path)
+
+        cache_key: Optional[str] = None
+        if self.cache is not None:
+            cache_key = ScanResultCache.key_for(api_client.configuration, extra=self.field_selector or "")
+            cached = self.cache.load(cache_key)
+            if cached is not None:
+                cached_rv, stored_at, cached_result = cached
+                if self.cache.is_fresh(stored_at):
+                    log.info("[context=%s] Serving cached scan (age < %ds)", context_name, self.cache.fresh_seconds)
+                    return cached_result
+                server_rv = self._current_resource_version(api_client, request_timeout_seconds)
+                if ScanResultCache.is_current(cached_rv, server_rv):
+                    log.info("[context=%s] Serving cached scan (resourceVersion unchanged)", context_name)
+                    self.cache.store(cache_key, cached_rv, cached_result)  # refresh age
+                    return cached_result
 
         log.info("[context=%s] Listing pods across all namespaces…", context_name)
-        pod_list_dict = self._list_pods_across_all_namespaces(
-            core_v1,
-            api_client,
-            page_limit,
-            request_timeout_seconds,
+
+        # Dedupe with a single flat set of (namespace, key) tuples: one tuple
+        # hash per container instead of an outer dict probe plus an inner set
+        # probe. Namespaces repeat across thousands of pods, so intern them —
+        # tuple hashing and equality then short-circuit on pointer identity.
+        seen: Set[Tuple[str, str]] = set()
+        images_by_namespace: DefaultDict[str, List[ContainerImage]] = defaultdict(list)
+        pod_count = 0
+        list_meta: Dict[str, Optional[str]] = {}
+
+        if parse_executor is not None:
+            pod_count = self._consume_parsed_pages(
+                api_client,
+                page_limit,
+                request_timeout_seconds,
+                parse_executor,
+                seen,
+                images_by_namespace,
+                list_meta,
+                self.field_selector,
+            )
+        else:
+            for pod in self._iter_pods_across_all_namespaces(
+                api_client,
+                page_limit,
+                request_timeout_seconds,
+                list_meta,
+                self.field_selector,
+            ):
+                pod_count += 1
+                namespace = sys.intern((pod.get("metadata", {}) or {}).get("namespace") or "default")
+
+                for image in self._collect_pod_images(pod):
+                    ukey = ImageReferenceParser.uniqueness_key(image.ref, image.digest)
+                    # first one wins; all carry same identity
+                    key = (namespace, ukey)
+                    if key not in seen:
+                        seen.add(key)
+                        images_by_namespace[namespace].append(image)
+
+        log.info("[context=%s] Processed %d pod(s)", context_name, pod_count)
+
+        # Stable, readable output: sort by (name, ref) and convert to dicts
+        result: Dict[str, List[Dict[str, Optional[str]]]] = {}
+        for namespace, ns_images in images_by_namespace.items():
+            sorted_images = sorted(ns_images, key=lambda x: (x.name, x.ref))
+            result[namespace] = [img.to_dict() for img in sorted_images]
+            log.info("[context=%s] namespace=%s -> %d unique image(s)", context_name, namespace, len(sorted_images))
+
+        if self.cache is not None and cache_key is not None and list_meta.get("resourceVersion"):
+            self.cache.store(cache_key, list_meta["resourceVersion"], result)
+
+        return result
+
+    @staticmethod
+    def _consume_parsed_pages(
+        api_client: ApiClient,
+        page_limit: Optional[int],
+        request_timeout_seconds: Optional[int],
+        parse_executor: ProcessPoolExecutor,
+        seen: Set[Tuple[str, str]],
+        images_by_namespace: DefaultDict[str, List[ContainerImage]],
+        list_meta: Dict[str, Optional[str]],
+        field_selector: Optional[str] = None,
+    ) -> int:
+        """
+        Fetch raw pod-list pages on this thread and parse them in worker
+        processes (_parse_pods_blob), merging the small (ref, name, digest)
+        tuples they return. While the thread blocks on a parse result it holds
+        no GIL, so pages from different contexts parse on separate cores.
+        """
+        pod_count = 0
+        continue_token: Optional[str] = None
+
+        while True:
+            response = KubernetesImageScanner._request_pod_page(
+                api_client, page_limit, continue_token, request_timeout_seconds, field_selector
+            )
+            blob = response.data
+
+            parsed, continue_token, resource_version, page_pods = parse_executor.submit(
+                _parse_pods_blob, blob
+            ).result()
+            pod_count += page_pods
+            if resource_version and "resourceVersion" not in list_meta:
+                list_meta["resourceVersion"] = resource_version
+
+            for ns, refs in parsed.items():
+                namespace = sys.intern(ns)
+                for ref, name, digest in refs:
+                    ukey = ImageReferenceParser.uniqueness_key(ref, digest)
+                    key = (namespace, ukey)
+                    if key not in seen:
+                        seen.add(key)
+                        images_by_namespace[namespace].append(
+                            ContainerImage(ref=ref, name=name, digest=digest)
+                        )
+
+            if not continue_token:
+                break
+            log.debug("Continuing pod list pagination with token length=%d", len(continue_token))
+
+        return pod_count
+
+    @staticmethod
+    def _request_pod_page(
+        api_client: ApiClient,
+        page_limit: Optional[int],
+        continue_token: Optional[str],
+        request_timeout_seconds: Optional[int],
+        field_selector: Optional[str],
+    ) -> urllib3.HTTPResponse:
+        """
+        Issue one raw /api/v1/pods page request, returning the un-preloaded
+        response. Single source of truth for the query string and headers so
+        the streaming and process-parse paths can't drift. gzip roughly halves
+        pod-list bytes on the wire (the apiserver compresses responses over
+        ~128KB); urllib3 decodes on read.
+        """
+        query_params: List[Tuple[str, Any]] = [("watch", "false")]
+        if field_selector:
+            query_params.append(("fieldSelector", field_selector))
+        if page_limit is not None:
+            query_params.append(("limit", page_limit))
+        if continue_token:
+            query_params.append(("continue", continue_token))
+
+        return api_client.call_api(
+            "/api/v1/pods",
+            "GET",
+            query_params=query_params,
+            header_params={"Accept": "application/json", "Accept-Encoding": "gzip"},
+            auth_settings=["BearerToken"],
+            response_type="str",
+            _return_http_data_only=True,
+            _preload_content=False,
+            _request_timeout=request_timeout_seconds,
         )
-        pods = pod_list_dict.get("items", [])
-        log.info("[context=%s] Retrieved %d pod(s)", context_name, len(pods))
 
-        # ns -> (uniqueness_key -> ContainerImage)
-        images_by_namespace: Dict[str, Dict[str, ContainerImage]] = {}
+    @staticmethod
+    def _current_resource_version(api_client: ApiClient, request_timeout_seconds: Optional[int]) -> Optional[str]:
+        """Cheap limit=1 pod list to read the current list resourceVersion; None on failure."""
+        try:
+            response = KubernetesImageScanner._request_pod_page(
+                api_client, 1, None, request_timeout_seconds, None
+            )
+            data = orjson.loads(response.data)
+            return (data.get("metadata") or {}).get("resourceVersion")
+        except Exception as exc:
+            log.debug("resourceVersion revalidation failed; rescanning: %s", exc)
+            return None
+
+    @classmethod
+    def _collect_pod_images(cls, pod: dict) -> List[ContainerImage]:
+        """
+        Extract images from one pod dict: container statuses first (digest-bearing),
+        spec.containers as the fallback for pods without populated status.
+        """
+        status_section = (pod.get("status", {}) or {})
+        collected: List[ContainerImage] = []
 
-        for pod in pods:
-            namespace = (pod.get("metadata", {}) or {}).get("namespace") or "default"
-            ns_bucket = images_by_namespace.setdefault(namespace, {})
+        for key in cls.CONTAINER_STATUS_KEYS:
+            collected.extend(ImageReferenceParser.from_statuses(status_section.get(key)))
 
-            status_section = (pod.get("status", {}) or {})
-            collected: List[ContainerImage] = []
+        if not collected:
+            spec_containers = (pod.get("spec", {}) or {}).get("containers", [])
+            collected.extend(ImageReferenceParser.from_container_specs(spec_containers))
 
-            for key in self.CONTAINER_STATUS_KEYS:
-                collected.extend(ImageReferenceParser.from_statuses(status_section.get(key)))
+        return collected
 
-            if not collected:
-                spec_containers = (pod.get("spec", {}) or {}).get("containers", [])
-                collected.extend(ImageReferenceParser.from_container_specs(spec_containers))
+    # ---- Async variant ---------------------------------------------------------
 
-            for image in collected:
-                ukey = ImageReferenceParser.uniqueness_key(image.ref, image.digest)
-                # first one wins; all carry same identity
-                ns_bucket.setdefault(ukey, image)
+    async def scan_multiple_contexts_async(
+        self,
+        context_names: Iterable[str],
+        max_workers: Optional[int] = None,
+        page_limit: Optional[int] = None,
+        request_timeout_seconds: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Async counterpart of scan_multiple_contexts: one event loop overlaps all
+        context scans on a handful of sockets instead of a thread per context,
+        with a semaphore capping in-flight scans. Same result shape.
+        """
+        names = list(context_names)
+        if not names:
+            return {}
+
+        concurrency = max_workers if max_workers is not None else min(32, len(names))
+        log.info("Scanning %d context(s) async with up to %d in flight…", len(names), concurrency)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def scan_one(name: str) -> Dict[str, List[Dict[str, Optional[str]]]]:
+            async with semaphore:
+                return await self.scan_single_context_async(name, page_limit, request_timeout_seconds)
+
+        results: Dict[str, Any] = {}
+        errors: Dict[str, str] = {}
+        tasks = {name: asyncio.ensure_future(scan_one(name)) for name in names}
+
+        for name, task in tasks.items():
+            try:
+                results[name] = await task
+            except ApiException as exc:
+                msg = f"Kubernetes API error: {exc}"
+                errors[name] = msg
+                log.error("[context=%s] %s", name, msg)
+            except Exception as exc:
+                msg = f"Unexpected error: {exc.__class__.__name__}: {exc}"
+                errors[name] = msg
+                log.exception("[context=%s] %s", name, msg)
+
+        if errors:
+            results["__errors__"] = errors
+
+        return results
+
+    async def scan_single_context_async(
+        self,
+        context_name: str,
+        page_limit: Optional[int] = None,
+        request_timeout_seconds: Optional[int] = None,
+    ) -> Dict[str, List[Dict[str, Optional[str]]]]:
+        """
+        Async scan of one context via aiohttp, paginating /api/v1/pods directly.
+        Pages are parsed with orjson, so resident memory is one page of pods.
+        """
+        host, headers, ssl_context = self.client_factory.new_async_connection(
+            context_name, self.kubeconfig_path
+        )
+
+        log.info("[context=%s] Listing pods across all namespaces (async)…", context_name)
+
+        seen: Set[Tuple[str, str]] = set()
+        images_by_namespace: DefaultDict[str, List[ContainerImage]] = defaultdict(list)
+        pod_count = 0
+
+        timeout = aiohttp.ClientTimeout(total=request_timeout_seconds)
+        connector = aiohttp.TCPConnector(ssl=ssl_context)
+
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout, headers=headers) as session:
+            continue_token: Optional[str] = None
+            while True:
+                params: Dict[str, str] = {"watch": "false"}
+                if self.field_selector:
+                    params["fieldSelector"] = self.field_selector
+                if page_limit is not None:
+                    params["limit"] = str(page_limit)
+                if continue_token:
+                    params["continue"] = continue_token
+
+                async with session.get(f"{host}/api/v1/pods", params=params) as response:
+                    if response.status >= 400:
+                        raise ApiException(status=response.status, reason=response.reason)
+                    data = orjson.loads(await response.read())
+
+                for pod in data.get("items", []):
+                    pod_count += 1
+                    namespace = sys.intern((pod.get("metadata", {}) or {}).get("namespace") or "default")
+                    for image in self._collect_pod_images(pod):
+                        ukey = ImageReferenceParser.uniqueness_key(image.ref, image.digest)
+                        key = (namespace, ukey)
+                        if key not in seen:
+                            seen.add(key)
+                            images_by_namespace[namespace].append(image)
+
+                continue_token = (data.get("metadata") or {}).get("continue")
+                if not continue_token:
+                    break
+                log.debug("Continuing pod list pagination with token length=%d", len(continue_token))
+
+        log.info("[context=%s] Processed %d pod(s)", context_name, pod_count)
 
-        # Stable, readable output: sort by (name, ref) and convert to dicts
         result: Dict[str, List[Dict[str, Optional[str]]]] = {}
-        for namespace, image_map in images_by_namespace.items():
-            sorted_images = sorted(image_map.values(), key=lambda x: (x.name, x.ref))
+        for namespace, ns_images in images_by_namespace.items():
+            sorted_images = sorted(ns_images, key=lambda x: (x.name, x.ref))
             result[namespace] = [img.to_dict() for img in sorted_images]
             log.info("[context=%s] namespace=%s -> %d unique image(s)", context_name, namespace, len(sorted_images))
 
@@ -364,36 +923,81 @@ class KubernetesImageScanner:
     # ---- Kubernetes pagination -------------------------------------------------
 
     @staticmethod
-    def _list_pods_across_all_namespaces(
-        core_v1: client.CoreV1Api,
+    def _iter_pods_across_all_namespaces(
         api_client: ApiClient,
         page_limit: Optional[int],
         request_timeout_seconds: Optional[int],
-    ) -> Dict:
+        list_meta: Optional[Dict[str, Optional[str]]] = None,
+        field_selector: Optional[str] = None,
+    ) -> Iterable[dict]:
         """
-        List pods across all namespaces with pagination, returning a plain dict
-        (via ApiClient.sanitize_for_serialization) compatible with our processing.
+        Yield pod dicts across all namespaces, one at a time, with pagination.
+        When given, list_meta receives the list's resourceVersion (first page).
+
+        Hits /api/v1/pods directly (raw JSON, no V1Pod model construction): for
+        large clusters the generated client's model deserialization plus the
+        sanitize-for-serialization walk dominates the scan cost, and we only
+        consume a handful of fields per pod anyway. Each page is stream-parsed
+        with ijson straight off the HTTP response, so peak memory stays at one
+        pod dict instead of the whole list, and parsing overlaps network I/O.
         """
-        items: List[dict] = []
         continue_token: Optional[str] = None
 
         while True:
-            response = core_v1.list_pod_for_all_namespaces(
-                limit=page_limit,
-                _continue=continue_token,
-                watch=False,
-                _request_timeout=request_timeout_seconds,
+            response = KubernetesImageScanner._request_pod_page(
+                api_client, page_limit, continue_token, request_timeout_seconds, field_selector
             )
-            data = api_client.sanitize_for_serialization(response)
-            items.extend(data.get("items", []))
-            continue_token = (data.get("metadata") or {}).get("continue")
+
+            # Walk the event stream once, building each pod object and grabbing
+            # the continue token wherever it appears relative to "items".
+            continue_token = None
+            builder: Optional[ijson.ObjectBuilder] = None
+            try:
+                for prefix, event, value in ijson.parse(response):
+                    if builder is not None:
+                        builder.event(event, value)
+                        if prefix == "items.item" and event == "end_map":
+                            yield builder.value
+                            builder = None
+                    elif prefix == "items.item" and event == "start_map":
+                        builder = ijson.ObjectBuilder()
+                        builder.event(event, value)
+                    elif prefix == "metadata.continue" and event == "string":
+                        continue_token = value
+                    elif prefix == "metadata.resourceVersion" and event == "string":
+                        if list_meta is not None and "resourceVersion" not in list_meta:
+                            list_meta["resourceVersion"] = value
+            finally:
+                response.release_conn()
 
             if not continue_token:
                 break
 
             log.debug("Continuing pod list pagination with token length=%d", len(continue_token))
 
-        return {"items": items}
+
+def _parse_pods_blob(
+    blob: bytes,
+) -> Tuple[Dict[str, List[Tuple[str, str, Optional[str]]]], Optional[str], Optional[str], int]:
+    """
+    Parse one raw pod-list page into per-namespace (ref, name, digest) tuples.
+
+    Top-level function so ProcessPoolExecutor can pickle it by reference; the
+    tuples it returns pickle far cheaper than pod dicts or model objects.
+
+    Returns (images_by_namespace, continue_token, resource_version, pod_count).
+    """
+    data = orjson.loads(blob)
+    images: DefaultDict[str, List[Tuple[str, str, Optional[str]]]] = defaultdict(list)
+    items = data.get("items", [])
+
+    for pod in items:
+        namespace = (pod.get("metadata", {}) or {}).get("namespace") or "default"
+        for image in KubernetesImageScanner._collect_pod_images(pod):
+            images[namespace].append((image.ref, image.name, image.digest))
+
+    meta = data.get("metadata") or {}
+    return dict(images), meta.get("continue"), meta.get("resourceVersion"), len(items)
 
 
 # --------------------------- I/O helpers ---------------------------
@@ -416,13 +1020,108 @@ class JsonWriter:
     """Minimal JSON writer for CLI/library output."""
 
     @staticmethod
-    def write(data, destination: Optional[str], pretty: bool) -> None:
-        text = json.dumps(data, indent=2 if pretty else None, sort_keys=False)
+    def write(
+        contexts: Dict[str, Dict[str, List[Dict[str, Optional[str]]]]],
+        errors: Dict[str, str],
+        destination: Optional[str],
+        pretty: bool,
+    ) -> None:
+        # orjson serializes at C speed and releases the GIL while doing so,
+        # which matters when scanner threads are still running.
         if not destination or destination == "-":
-            sys.stdout.write(text + "\n")
+            JsonWriter._stream(sys.stdout.buffer, contexts, errors, pretty)
+            sys.stdout.buffer.write(b"\n")
+            sys.stdout.buffer.flush()
             return
-        with open(destination, "w", encoding="utf-8") as fh:
-            fh.write(text)
+        with open(destination, "wb") as fh:
+            JsonWriter._stream(fh, contexts, errors, pretty)
+
+    @staticmethod
+    def _stream(fh, contexts, errors, pretty: bool) -> None:
+        """
+        Emit {"contexts": {...}, "errors": {...}} one context at a time, so the
+        peak serialization buffer is the largest single context rather than the
+        whole result. Pretty mode indents each chunk; the output stays valid
+        JSON with per-context indentation depth.
+        """
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        fh.write(b'{"contexts":{')
+        first = True
+        for name, namespaces in contexts.items():
+            if not first:
+                fh.write(b",")
+            first = False
+            fh.write(orjson.dumps(name))
+            fh.write(b":")
+            fh.write(orjson.dumps(namespaces, option=option))
+        fh.write(b'},"errors":')
+        fh.write(orjson.dumps(errors, option=option))
+        fh.write(b"}")
+
+
+class ScanResultCache:
+    """
+    On-disk cache of per-context scan results, revalidated by resourceVersion.
+
+    Re-scanning a mostly-static cluster re-downloads and re-parses the whole
+    pod list; a cheap limit=1 list tells us whether anything could have changed.
+    Entries younger than fresh_seconds are served without even that round-trip.
+    Keys hash the API server endpoint + CA so renamed contexts share entries.
+    """
+
+    DEFAULT_DIR = "~/.cache/k8s-image-lister"
+    FRESH_SECONDS = 60
+
+    def __init__(self, cache_dir: Optional[str] = None, fresh_seconds: int = FRESH_SECONDS) -> None:
+        self.cache_dir = os.path.expanduser(cache_dir or self.DEFAULT_DIR)
+        self.fresh_seconds = fresh_seconds
+
+    @staticmethod
+    def key_for(configuration: client.Configuration, extra: str = "") -> str:
+        """
+        Cache key from server identity: endpoint + CA bundle path, plus any
+        extra material that changes what a scan returns (e.g. field selectors).
+        """
+        material = f"{configuration.host}\n{configuration.ssl_ca_cert or ''}\n{extra}"
+        return hashlib.sha256(material.encode()).hexdigest()
+
+    def _path_for(self, cache_key: str) -> str:
+        return os.path.join(self.cache_dir, f"{cache_key}.json")
+
+    def load(self, cache_key: str) -> Optional[Tuple[str, float, Dict]]:
+        """Return (resource_version, stored_at, result) or None; a broken entry is a miss."""
+        try:
+            with open(self._path_for(cache_key), "rb") as fh:
+                entry = orjson.loads(fh.read())
+            return entry["resourceVersion"], entry["storedAt"], entry["result"]
+        except (OSError, orjson.JSONDecodeError, KeyError, TypeError):
+            return None
+
+    def store(self, cache_key: str, resource_version: str, result: Dict) -> None:
+        """Persist a scan result; cache write failures are logged, never fatal."""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            payload = orjson.dumps(
+                {"resourceVersion": resource_version, "storedAt": time.time(), "result": result}
+            )
+            with open(self._path_for(cache_key), "wb") as fh:
+                fh.write(payload)
+        except OSError as exc:
+            log.debug("Could not write scan cache entry: %s", exc)
+
+    def is_fresh(self, stored_at: float) -> bool:
+        return (time.time() - stored_at) <= self.fresh_seconds
+
+    @staticmethod
+    def is_current(cached_rv: str, server_rv: Optional[str]) -> bool:
+        """True when the server's resourceVersion has not advanced past the cached one."""
+        if not server_rv:
+            return False
+        try:
+            return int(server_rv) <= int(cached_rv)
+        except (TypeError, ValueError):
+            # Opaque (non-numeric) versions: only exact match proves currency.
+            return server_rv == cached_rv
 
 
 # --------------------------- Library convenience wrapper ---------------------------
@@ -436,6 +1135,11 @@ def scan_images(
     timeout_seconds: Optional[int] = None,
     output_path: Optional[str] = None,   # "-" writes to stdout
     pretty: bool = False,
+    use_asyncio: bool = False,
+    use_cache: bool = False,
+    parse_workers: Optional[int] = None,
+    include_terminated: bool = False,
+    max_workers_per_host: Optional[int] = None,
 ) -> ScanResult:
     """
     Convenience wrapper for library users: discover contexts (if needed), scan,
@@ -446,7 +1150,11 @@ def scan_images(
       - Else if `contexts` is provided, scans those.
       - Else scans all contexts by default.
     """
-    scanner = KubernetesImageScanner(kubeconfig_path=kubeconfig_path)
+    scanner = KubernetesImageScanner(
+        kubeconfig_path=kubeconfig_path,
+        cache=ScanResultCache() if use_cache else None,
+        include_terminated=include_terminated,
+    )
 
     if all_contexts or contexts is None:
         chosen_contexts = scanner.list_all_context_names()
@@ -458,6 +1166,9 @@ def scan_images(
         max_workers=max_workers,
         page_limit=page_limit,
         request_timeout_seconds=timeout_seconds,
+        use_asyncio=use_asyncio,
+        parse_workers=parse_workers,
+        max_workers_per_host=max_workers_per_host,
     )
 
     errors = {}
@@ -469,7 +1180,7 @@ def scan_images(
     }
 
     if output_path is not None:
-        JsonWriter.write({"contexts": contexts_map, "errors": errors}, output_path, pretty)
+        JsonWriter.write(contexts_map, errors, output_path, pretty)
 
     return ScanResult(contexts=contexts_map, errors=errors)
 
@@ -517,6 +1228,26 @@ class CommandLineApp:
             type=int,
             help="Max parallel contexts (default: min(32, number of contexts))).",
         )
+        parser.add_argument(
+            "--max-workers-per-host",
+            type=int,
+            default=None,
+            help="Max parallel scans per API server, for contexts sharing a "
+                 "control plane (default: 4).",
+        )
+        parser.add_argument(
+            "--asyncio",
+            action="store_true",
+            dest="use_asyncio",
+            help="Scan contexts on one asyncio event loop (aiohttp) instead of worker threads.",
+        )
+        parser.add_argument(
+            "--parse-workers",
+            type=int,
+            default=None,
+            help="Parse pod-list pages in this many worker processes "
+                 "(default: in-thread; ignored with --asyncio).",
+        )
         parser.add_argument(
             "--limit",
             type=int,
@@ -529,6 +1260,20 @@ class CommandLineApp:
             default=None,
             help="Per-API-call timeout in seconds (default: none).",
         )
+        parser.add_argument(
+            "--include-terminated",
+            action="store_true",
+            help="Also scan Succeeded/Failed pods. Off by default: terminal pods "
+                 "are filtered server-side, so digests seen only in completed "
+                 "pods are omitted.",
+        )
+        parser.add_argument(
+            "--cache",
+            action="store_true",
+            dest="use_cache",
+            help="Cache results on disk per cluster and skip re-scans while the "
+                 "pod list resourceVersion is unchanged (sync path only).",
+        )
         parser.add_argument(
             "--log-level",
             default="INFO",
@@ -556,6 +1301,11 @@ class CommandLineApp:
                 timeout_seconds=args.timeout,
                 output_path=args.output,      # "-" -> stdout
                 pretty=args.pretty,
+                use_asyncio=args.use_asyncio,
+                use_cache=args.use_cache,
+                parse_workers=args.parse_workers,
+                include_terminated=args.include_terminated,
+                max_workers_per_host=args.max_workers_per_host,
             )
             # Nothing else to do; scan_images already wrote to output_path if provided.
             # Exit code reflects severe top-level errors only; per-context errors are in JSON.